@@ -9,16 +9,87 @@ Usage:
     python scraper.py
 """
 
+import asyncio
+import atexit
 import datetime
+import functools
+import json
 import os
-from typing import Optional, Dict
-from bs4 import BeautifulSoup
+import random
+import re
+import shutil
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urljoin, urlparse
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Constants
 QWANTZ_BASE_URL = 'https://www.qwantz.com/'
-INVALID_FILENAME_CHARS = ['/', '\\', '?', '%', '*', ':', '|', '"', '<', '>', '.']
+QWANTZ_ARCHIVE_URL = QWANTZ_BASE_URL + 'archive.php'
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Translation table deleting characters that are invalid in filenames;
+# str.translate scans the string in C rather than a per-character loop.
+_FILENAME_DROP = str.maketrans('', '', '/\\?%*:|"<>.')
+
+# extract_comic_data only needs the <img class="comic"> tag; parsing just
+# that subtree skips building a node tree for the rest of the homepage.
+_COMIC_IMG_STRAINER = SoupStrainer('img', attrs={'class': 'comic'})
+
+# The archive page is only mined for its links, e.g.
+# <a href="index.php?comic=5109">December 4th, 2025</a>
+_ARCHIVE_LINK_STRAINER = SoupStrainer('a')
+_ARCHIVE_DATE_RE = re.compile(r'(\w+ \d+)(?:st|nd|rd|th)(, \d{4})')
+
+_COPY_CHUNK_SIZE = 64 * 1024  # socket-to-file copy granularity
+
+# Cached ETag/Last-Modified validators live next to the comic files, so a
+# repeat run can send conditional GETs and skip unchanged payloads.
+_HTTP_CACHE_NAME = 'http_cache.json'
+
+# Prefer lxml's C-backed parser (3-5x faster DOM build than the pure-Python
+# html.parser); fall back to the stdlib parser if lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+_HEADERS = {
+    'User-Agent': 'qwantz-daily scraper (https://github.com/AI-Enthusiast/qwantz-daily)',
+    # brotli (decoded transparently via the brotli package) compresses the
+    # HTML roughly 20% smaller than gzip
+    'Accept-Encoding': 'br, gzip, deflate',
+}
+
+# Shared session so the TCP/TLS connection to qwantz.com is reused between
+# the homepage fetch and the image download (one handshake instead of two).
+# Transient 5xx/429 responses and connection errors retry with exponential
+# backoff inside the session instead of failing the whole run.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_RETRY = Retry(total=4, backoff_factor=0.5,
+               status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=frozenset(['GET']))
+_ADAPTER = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=_RETRY)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+atexit.register(_SESSION.close)
+
+
+@functools.cache
+def _project_root() -> str:
+    """
+    Return the absolute path of the project root directory.
+
+    Computed once and memoized; the result never changes within a run.
+    """
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -31,23 +102,29 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         A sanitized filename string with invalid characters removed
     """
-    return ''.join(char for char in filename if char not in INVALID_FILENAME_CHARS)
+    return filename.translate(_FILENAME_DROP)
 
 
-def fetch_webpage(url: str) -> Optional[BeautifulSoup]:
+def fetch_webpage(url: str,
+                  parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
     """
     Fetch and parse a webpage into a BeautifulSoup object.
 
     Args:
         url: The URL of the webpage to fetch
+        parse_only: Optional SoupStrainer restricting the parse to
+            matching tags (skips building the rest of the tree)
 
     Returns:
         BeautifulSoup object if successful, None if request fails
     """
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        # Hand the raw bytes to the parser: skips requests' full-body
+        # decode (and charset detection); the parser sniffs the encoding
+        # from the document itself
+        return BeautifulSoup(response.content, _HTML_PARSER, parse_only=parse_only)
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
@@ -92,70 +169,180 @@ def extract_comic_data(soup: BeautifulSoup) -> Optional[Dict[str, str]]:
         return None
 
 
-def download_image(image_url: str) -> Optional[bytes]:
+def _load_http_cache(cache_dir: str) -> Dict[str, Dict[str, str]]:
     """
-    Download image data from a URL.
+    Load saved HTTP validators (ETag / Last-Modified) for a directory.
 
     Args:
-        image_url: The URL of the image to download
+        cache_dir: The directory holding the cache file
 
     Returns:
-        Image data as bytes if successful, None if download fails
+        Mapping of URL to its saved validators ({} if none saved yet)
     """
     try:
-        response = requests.get(image_url)
-        response.raise_for_status()
-        return response.content
-    except requests.RequestException as e:
-        print(f"Error downloading image from {image_url}: {e}")
-        return None
+        with open(os.path.join(cache_dir, _HTTP_CACHE_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_http_cache(cache_dir: str, cache: Dict[str, Dict[str, str]]) -> None:
+    """
+    Persist HTTP validators for a directory.
+
+    Args:
+        cache_dir: The directory holding the cache file
+        cache: Mapping of URL to its validators
+    """
+    try:
+        with open(os.path.join(cache_dir, _HTTP_CACHE_NAME), 'w',
+                  encoding='utf-8') as f:
+            json.dump(cache, f)
+    except IOError as e:
+        print(f"Warning: could not save HTTP cache in {cache_dir}: {e}")
+
+
+def _conditional_headers(cache: Dict[str, Dict[str, str]], url: str) -> Dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers for a URL.
+
+    Args:
+        cache: Mapping of URL to its saved validators
+        url: The URL about to be requested
+
+    Returns:
+        Header dict ({} if no validators are saved for the URL)
+    """
+    entry = cache.get(url, {})
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
 
 
-def save_image(image_data: bytes, filepath: str) -> bool:
+def _store_validators(cache: Dict[str, Dict[str, str]], url: str,
+                      response_headers) -> None:
     """
-    Save image data to a file.
+    Record a response's ETag / Last-Modified validators for a URL.
 
     Args:
-        image_data: The image data as bytes
+        cache: Mapping of URL to its saved validators
+        url: The URL that was requested
+        response_headers: The response's header mapping
+    """
+    entry = {}
+    if response_headers.get('ETag'):
+        entry['etag'] = response_headers['ETag']
+    if response_headers.get('Last-Modified'):
+        entry['last_modified'] = response_headers['Last-Modified']
+    if entry:
+        cache[url] = entry
+
+
+def download_image_to(image_url: str, filepath: str) -> bool:
+    """
+    Download an image from a URL, streaming it directly to a file.
+
+    Bytes flow chunk-by-chunk from the socket to disk, so the image is
+    never materialized in memory as a whole. Sends a conditional GET
+    when validators from a previous run are cached next to the file, so
+    an unchanged image is not re-downloaded.
+
+    Args:
+        image_url: The URL of the image to download
         filepath: The path where the image should be saved
 
     Returns:
-        True if successful, False otherwise
+        True if successful (including a 304 Not Modified), False otherwise
     """
     try:
-        with open(filepath, 'wb') as handler:
-            handler.write(image_data)
+        cache_dir = os.path.dirname(filepath) or '.'
+        cache = _load_http_cache(cache_dir)
+        with _SESSION.get(image_url, stream=True, timeout=REQUEST_TIMEOUT,
+                          headers=_conditional_headers(cache, image_url)) as response:
+            if response.status_code == 304:
+                print(f"Image unchanged on server, skipping download: {image_url}")
+                return True
+            response.raise_for_status()
+            response.raw.decode_content = True  # transparently un-gzip
+            # Stream into a temp file, then rename atomically so the
+            # directory never holds a half-written image
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as handler:
+                shutil.copyfileobj(response.raw, handler, length=_COPY_CHUNK_SIZE)
+            os.replace(tmp_path, filepath)
+            _store_validators(cache, image_url, response.headers)
+        _save_http_cache(cache_dir, cache)
         return True
+    except requests.RequestException as e:
+        print(f"Error downloading image from {image_url}: {e}")
+        return False
     except IOError as e:
         print(f"Error saving image to {filepath}: {e}")
         return False
 
 
-def get_file_extension(url: str) -> str:
+def _comic_paths(image_url: str, out_dir: str) -> Tuple[str, str, str]:
+    """
+    Derive local file paths for a comic from its image URL.
+
+    Args:
+        image_url: The full URL of the comic image
+        out_dir: The directory the comic files should be saved in
+
+    Returns:
+        Tuple of (base_filename, image_path, metadata_path)
+    """
+    # One parse: urlparse strips query strings and fragments, then
+    # basename/splitext separate the name from its extension
+    base_filename, extension = os.path.splitext(
+        os.path.basename(urlparse(image_url).path))
+    extension = extension.lstrip('.').lower()
+    return (base_filename,
+            os.path.join(out_dir, f"{base_filename}.{extension}"),
+            os.path.join(out_dir, f"{base_filename}_metadata.txt"))
+
+
+def _write_metadata(metadata_path: str, comic_data: Dict[str, str]) -> bool:
     """
-    Extract file extension from a URL.
+    Write a comic's metadata file.
 
     Args:
-        url: The URL to extract extension from
+        metadata_path: The path where the metadata should be saved
+        comic_data: Dictionary containing 'image_url' and 'title' keys
 
     Returns:
-        File extension (e.g., 'png', 'jpg')
+        True if successful, False otherwise
     """
-    return url.split('.')[-1].split('?')[0]  # Handle query parameters
+    try:
+        # Format once and write in a single call
+        Path(metadata_path).write_text(
+            f"Title: {comic_data['title']}\n"
+            f"Image URL: {comic_data['image_url']}\n",
+            encoding='utf-8')
+        return True
+    except IOError as e:
+        print(f"Error saving metadata to {metadata_path}: {e}")
+        return False
 
 
-def get_current_comic() -> bool:
+def get_current_comic(out_dir: str) -> bool:
     """
     Download the current latest Dinosaur Comics comic.
 
     This function fetches the Dinosaur Comics homepage to get the latest comic,
-    then downloads the image and saves metadata to the current working directory.
+    then downloads the image and saves metadata to the given directory.
+
+    Args:
+        out_dir: The directory the comic files should be saved in
 
     Returns:
         True if successful, False otherwise
     """
-    # Fetch the main Qwantz page
-    soup = fetch_webpage(QWANTZ_BASE_URL)
+    # Fetch the main Qwantz page (parsing only the comic <img> tag)
+    soup = fetch_webpage(QWANTZ_BASE_URL, parse_only=_COMIC_IMG_STRAINER)
     if soup is None:
         return False
 
@@ -164,36 +351,267 @@ def get_current_comic() -> bool:
     if comic_data is None:
         return False
 
-    # Create filename from image URL
-    image_filename = comic_data['image_url'].split('/')[-1]
-    base_filename = image_filename.rsplit('.', 1)[0]  # Remove extension
+    base_filename, image_path, metadata_path = _comic_paths(
+        comic_data['image_url'], out_dir)
 
-    # Download the image
-    image_data = download_image(comic_data['image_url'])
-    if image_data is None:
+    # Stream the image to disk
+    if not download_image_to(comic_data['image_url'], image_path):
         return False
 
-    # Save the image
-    file_extension = get_file_extension(comic_data['image_url'])
-    image_path = f"{base_filename}.{file_extension}"
-    if not save_image(image_data, image_path):
+    # Save metadata
+    if not _write_metadata(metadata_path, comic_data):
         return False
 
-    # Save metadata
-    metadata_path = f"{base_filename}_metadata.txt"
+    print(f"Successfully downloaded current comic: {base_filename}")
+    print(f"Title: {comic_data['title']}")
+    return True
+
+
+async def _fetch_bytes(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """
+    Fetch the raw body of a URL over a shared aiohttp session.
+
+    Args:
+        session: The aiohttp session to fetch through
+        url: The URL to fetch
+
+    Returns:
+        Response body as bytes if successful, None if the request fails
+    """
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+
+async def _download_image_to(session: aiohttp.ClientSession,
+                             image_url: str, filepath: str) -> bool:
+    """
+    Download an image over an aiohttp session, streaming it to a file.
+
+    Sends a conditional GET when validators from a previous run are
+    cached next to the file, so an unchanged image is not re-downloaded.
+
+    Args:
+        session: The aiohttp session to fetch through
+        image_url: The URL of the image to download
+        filepath: The path where the image should be saved
+
+    Returns:
+        True if successful (including a 304 Not Modified), False otherwise
+    """
     try:
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            f.write(f"Title: {comic_data['title']}\n")
-            f.write(f"Image URL: {comic_data['image_url']}\n")
+        cache_dir = os.path.dirname(filepath) or '.'
+        cache = _load_http_cache(cache_dir)
+        async with session.get(
+                image_url,
+                headers=_conditional_headers(cache, image_url)) as response:
+            if response.status == 304:
+                print(f"Image unchanged on server, skipping download: {image_url}")
+                return True
+            response.raise_for_status()
+            # Stream into a temp file, then rename atomically so the
+            # directory never holds a half-written image
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as handler:
+                async for chunk in response.content.iter_chunked(_COPY_CHUNK_SIZE):
+                    handler.write(chunk)
+            os.replace(tmp_path, filepath)
+            _store_validators(cache, image_url, response.headers)
+        _save_http_cache(cache_dir, cache)
+        return True
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error downloading image from {image_url}: {e}")
+        return False
     except IOError as e:
-        print(f"Error saving metadata to {metadata_path}: {e}")
+        print(f"Error saving image to {filepath}: {e}")
         return False
 
-    print(f"Successfully downloaded current comic: {base_filename}")
+
+def _make_client_session() -> aiohttp.ClientSession:
+    """
+    Build an aiohttp session configured for scraping qwantz.com.
+
+    Returns:
+        A ClientSession with a bounded connector, DNS caching and the
+        shared request headers
+    """
+    connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(connect=REQUEST_TIMEOUT[0], total=60)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                 headers=_HEADERS)
+
+
+async def _scrape_comic(session: aiohttp.ClientSession, page_url: str,
+                        out_dir: str) -> bool:
+    """
+    Scrape the comic from a Qwantz page into a directory.
+
+    Fetches the page, parses it in a worker thread (so the event loop
+    stays free), then streams the comic image and writes its metadata.
+
+    Args:
+        session: The aiohttp session to fetch through
+        page_url: The Qwantz page holding the comic
+        out_dir: The directory the comic files should be saved in
+
+    Returns:
+        True if successful, False otherwise
+    """
+    # Fetch the comic page
+    html = await _fetch_bytes(session, page_url)
+    if html is None:
+        return False
+
+    # Parse in a worker thread so the event loop stays free
+    loop = asyncio.get_running_loop()
+    soup = await loop.run_in_executor(
+        None, lambda: BeautifulSoup(html, _HTML_PARSER,
+                                    parse_only=_COMIC_IMG_STRAINER))
+
+    # Extract comic data
+    comic_data = extract_comic_data(soup)
+    if comic_data is None:
+        return False
+
+    base_filename, image_path, metadata_path = _comic_paths(
+        comic_data['image_url'], out_dir)
+
+    # Stream the image to disk over the already-warm connection
+    if not await _download_image_to(session, comic_data['image_url'], image_path):
+        return False
+
+    # Save metadata
+    if not _write_metadata(metadata_path, comic_data):
+        return False
+
+    print(f"Successfully downloaded comic: {base_filename}")
     print(f"Title: {comic_data['title']}")
     return True
 
 
+async def get_current_comic_async(out_dir: str) -> bool:
+    """
+    Download the current latest Dinosaur Comics comic over a single
+    aiohttp session.
+
+    DNS, TCP and TLS are set up once and reused for both the homepage
+    fetch and the image download.
+
+    Args:
+        out_dir: The directory the comic files should be saved in
+
+    Returns:
+        True if successful, False otherwise
+    """
+    async with _make_client_session() as session:
+        return await _scrape_comic(session, QWANTZ_BASE_URL, out_dir)
+
+
+async def _archive_index(session: aiohttp.ClientSession) -> Dict[str, str]:
+    """
+    Map ISO dates to comic page URLs using the Qwantz archive page.
+
+    Args:
+        session: The aiohttp session to fetch through
+
+    Returns:
+        Dictionary mapping 'YYYY-MM-DD' to the comic page URL for that
+        day ({} if the archive page can't be fetched)
+    """
+    html = await _fetch_bytes(session, QWANTZ_ARCHIVE_URL)
+    if html is None:
+        return {}
+
+    loop = asyncio.get_running_loop()
+    soup = await loop.run_in_executor(
+        None, lambda: BeautifulSoup(html, _HTML_PARSER,
+                                    parse_only=_ARCHIVE_LINK_STRAINER))
+
+    index: Dict[str, str] = {}
+    for link in soup.find_all('a', href=True):
+        match = _ARCHIVE_DATE_RE.search(link.get_text())
+        if not match:
+            continue
+        try:
+            # Drop the ordinal suffix: "December 4th, 2025" -> "December 4, 2025"
+            day = datetime.datetime.strptime(
+                match.group(1) + match.group(2), '%B %d, %Y')
+        except ValueError:
+            continue
+        index.setdefault(day.date().isoformat(),
+                         urljoin(QWANTZ_BASE_URL, link['href']))
+    return index
+
+
+async def _backfill_one(semaphore: asyncio.Semaphore,
+                        session: aiohttp.ClientSession,
+                        date: str, page_url: str) -> bool:
+    """
+    Scrape one archived comic into its data/<date>/ directory.
+
+    Args:
+        semaphore: Gate bounding how many scrapes run at once
+        session: The aiohttp session to fetch through
+        date: ISO date of the comic ('YYYY-MM-DD')
+        page_url: The archive page URL for that comic
+
+    Returns:
+        True if successful, False otherwise
+    """
+    async with semaphore:
+        # Small jitter so concurrent requests don't hammer the server in
+        # perfect lockstep
+        await asyncio.sleep(random.uniform(0.0, 0.1))
+        out_dir = os.path.join(_project_root(), 'data', date)
+        os.makedirs(out_dir, exist_ok=True)
+        return await _scrape_comic(session, page_url, out_dir)
+
+
+async def backfill(dates: List[str], concurrency: int = 8) -> bool:
+    """
+    Download the comics for several past dates concurrently.
+
+    The archive page is fetched once to resolve each date to its comic
+    page, then up to `concurrency` comics are scraped in parallel over
+    one shared session.
+
+    Args:
+        dates: ISO dates ('YYYY-MM-DD') to backfill
+        concurrency: Maximum number of comics scraped at once
+
+    Returns:
+        True if every requested date was downloaded, False otherwise
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    async with _make_client_session() as session:
+        index = await _archive_index(session)
+
+        missing = [date for date in dates if date not in index]
+        for date in missing:
+            print(f"No archived comic found for {date}")
+
+        # return_exceptions keeps one failed date from aborting the rest
+        # of the batch; an exception result counts as a failure
+        results = await asyncio.gather(
+            *[_backfill_one(semaphore, session, date, index[date])
+              for date in dates if date in index],
+            return_exceptions=True)
+
+    succeeded = True
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"Error during backfill: {result}")
+            succeeded = False
+        elif not result:
+            succeeded = False
+
+    return succeeded and not missing
+
+
 def setup_daily_directory() -> str:
     """
     Create and return the path to today's data directory.
@@ -203,12 +621,12 @@ def setup_daily_directory() -> str:
     Returns:
         The absolute path to the created directory
     """
-    # Get current date
-    date = datetime.datetime.now().strftime("%Y-%m-%d")
+    # Get current date (isoformat is the YYYY-MM-DD form directly, with no
+    # locale-aware strftime pass)
+    date = datetime.date.today().isoformat()
 
     # Construct path to data directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    data_dir = os.path.join(project_root, 'data', date)
+    data_dir = os.path.join(_project_root(), 'data', date)
 
     # Create directory if it doesn't exist
     os.makedirs(data_dir, exist_ok=True)
@@ -222,14 +640,13 @@ def main():
 
     Sets up the daily directory and downloads the current Dinosaur Comics comic.
     """
-    # Create and change to today's data directory
+    # Create today's data directory
     data_dir = setup_daily_directory()
-    os.chdir(data_dir)
 
     print(f"Saving comic to: {data_dir}")
 
     # Download the current comic
-    success = get_current_comic()
+    success = asyncio.run(get_current_comic_async(data_dir))
 
     if success:
         print("Comic download completed successfully!")
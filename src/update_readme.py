@@ -1,6 +1,36 @@
+import functools
 import os
-import glob
+import re
 from pathlib import Path
+from urllib.parse import quote
+
+# Matches the "Title:" line in a comic's metadata file
+_TITLE_RE = re.compile(r'^Title:\s*(.*)$', re.MULTILINE)
+
+# README layout, parsed once at import; reused as-is when bulk-generating
+# pages for many comics
+_README_TMPL = """# Dinosaur Comics Daily
+
+#### {date}
+
+![{filename}]({image_path})
+
+**{title}**
+
+---
+
+*This README is automatically updated with the latest Dinosaur Comics comic.*
+"""
+
+
+@functools.cache
+def _project_root():
+    """
+    Return the absolute path of the project root directory.
+
+    Computed once and memoized; the result never changes within a run.
+    """
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def get_most_recent_comic():
@@ -8,35 +38,37 @@ def get_most_recent_comic():
     Find the most recent Dinosaur Comics comic in the data directory.
     Returns: tuple of (date, comic_title, image_path, metadata_title) or None if no comic found
     """
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root = _project_root()
     data_dir = os.path.join(project_root, 'data')
 
     if not os.path.exists(data_dir):
         print(f"Data directory not found: {data_dir}")
         return None
 
-    # Get all date directories, sorted in reverse order (most recent first)
-    date_dirs = sorted([d for d in os.listdir(data_dir)
-                       if os.path.isdir(os.path.join(data_dir, d))],
-                      reverse=True)
+    # Collect date directories; scandir carries type info, so no extra
+    # stat call per entry
+    with os.scandir(data_dir) as entries:
+        date_dirs = [entry.name for entry in entries
+                     if entry.is_dir(follow_symlinks=False)]
 
     if not date_dirs:
         print("No date directories found in data folder")
         return None
 
-    # Get the most recent date directory
-    most_recent_date = date_dirs[0]
+    # ISO-date names sort lexically, so max() finds the most recent
+    most_recent_date = max(date_dirs)
     most_recent_dir = os.path.join(data_dir, most_recent_date)
 
-    # Find PNG files in that directory
-    png_files = glob.glob(os.path.join(most_recent_dir, '*.png'))
+    # Find the first PNG file in that directory (there should typically
+    # be only one); stops scanning at the first match
+    with os.scandir(most_recent_dir) as entries:
+        image_path = next((entry.path for entry in entries
+                           if entry.is_file() and entry.name.endswith('.png')),
+                          None)
 
-    if not png_files:
+    if image_path is None:
         print(f"No PNG files found in {most_recent_dir}")
         return None
-
-    # Get the first PNG file (there should typically be only one)
-    image_path = png_files[0]
     comic_filename = Path(image_path).stem  # Get filename without extension
 
     # Read metadata file to get the title
@@ -44,17 +76,16 @@ def get_most_recent_comic():
     metadata_title = "No title available"
 
     if os.path.exists(metadata_path):
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.startswith('Title:'):
-                    metadata_title = line.replace('Title:', '').strip()
-                    break
+        match = _TITLE_RE.search(Path(metadata_path).read_text(encoding='utf-8'))
+        if match:
+            metadata_title = match.group(1).strip()
 
     # Return relative path from project root
     rel_image_path = os.path.relpath(image_path, project_root)
 
-    # URL-encode spaces for GitHub compatibility
-    rel_image_path = rel_image_path.replace(' ', '%20')
+    # Normalize separators and URL-encode all unsafe characters (spaces,
+    # parentheses, '#', ...) for GitHub compatibility
+    rel_image_path = quote(rel_image_path.replace(os.sep, '/'), safe='/')
 
     return (most_recent_date, comic_filename, rel_image_path, metadata_title)
 
@@ -63,8 +94,7 @@ def update_readme():
     """
     Update the README.md file with the most recent Dinosaur Comics comic.
     """
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    readme_path = os.path.join(project_root, 'README.md')
+    readme_path = os.path.join(_project_root(), 'README.md')
 
     comic_info = get_most_recent_comic()
 
@@ -75,22 +105,18 @@ def update_readme():
     date, filename, image_path, title = comic_info
 
     # Create the README content
-    readme_content = f"""# Dinosaur Comics Daily
-
-#### {date}
-
-![{filename}]({image_path})
-
-**{title}**
-
----
-
-*This README is automatically updated with the latest Dinosaur Comics comic.*
-"""
-
-    # Write to README
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    readme_content = _README_TMPL.format_map({
+        'date': date,
+        'filename': filename,
+        'image_path': image_path,
+        'title': title,
+    })
+
+    # Write to a temp file in the same directory, then rename atomically
+    # so readers never see a half-written README
+    tmp_path = readme_path + '.tmp'
+    Path(tmp_path).write_text(readme_content, encoding='utf-8')
+    os.replace(tmp_path, readme_path)
 
     print(f"README updated successfully with comic: {filename}")
 